@@ -45,7 +45,9 @@ IF NOT EXIST requirements.txt.cached (
 
 REM Start the Python service in a new, minimized background window
 echo Starting transcript service on http://127.0.0.1:8000...
-start "Transcript Service" /B uvicorn main:app --host 127.0.0.1 --port 8000
+REM uvloop is not available on Windows, so only the httptools parser and the
+REM longer keep-alive are enabled here.
+start "Transcript Service" /B uvicorn main:app --host 127.0.0.1 --port 8000 --http httptools --timeout-keep-alive 75 --no-access-log
 cd ..
 
 REM Give the python service a moment to start
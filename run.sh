@@ -52,9 +52,12 @@ else
     cp requirements.txt requirements.txt.cached
 fi
 
-# Start the Python service in the background
+# Start the Python service in the background. uvloop and httptools replace the
+# stdlib event loop and HTTP parser with C implementations, and the raised
+# keep-alive timeout keeps the Go client's pooled connections open between
+# transcript requests.
 echo "Starting transcript service on http://127.0.0.1:8000..."
-uvicorn main:app --host 127.0.0.1 --port 8000 &
+uvicorn main:app --host 127.0.0.1 --port 8000 --loop uvloop --http httptools --timeout-keep-alive 75 --no-access-log &
 TRANSCRIPT_PID=$!
 cd ..
 